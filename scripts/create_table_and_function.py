@@ -1,4 +1,7 @@
 import logging
+from functools import lru_cache
+
+import sqlalchemy
 from sqlalchemy import create_engine, MetaData, Table, Column, Integer, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import text
@@ -6,6 +9,12 @@ from sqlalchemy.sql import text
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _engine(db_uri: str) -> sqlalchemy.engine.Engine:
+    """Build one engine per DSN; engine construction is expensive."""
+    return create_engine(db_uri, pool_pre_ping=True, pool_size=2)
+
+
 def create_table_and_function(db_uri: str) -> None:
     """Create a table and function in the database.
 
@@ -13,7 +22,7 @@ def create_table_and_function(db_uri: str) -> None:
         db_uri (str): The URI of the database.
     """
     try:
-        engine = create_engine(db_uri)
+        engine = _engine(db_uri)
         metadata = MetaData()
 
         # Define the table
@@ -27,9 +36,6 @@ def create_table_and_function(db_uri: str) -> None:
             Column("story_name", Text, nullable=True),
         )
 
-        # Create the table
-        metadata.create_all(engine)
-
         # Define the function
         get_user_by_email_func = text(
             """
@@ -42,8 +48,11 @@ def create_table_and_function(db_uri: str) -> None:
         """
         )
 
-        # Create the function
+        # Create the table (skipping the per-column existence round-trips
+        # when it is already there) and the function in one transaction
         with engine.begin() as connection:
+            if not sqlalchemy.inspect(connection).has_table("stories"):
+                metadata.create_all(connection, checkfirst=False)
             connection.execute(get_user_by_email_func)
             logger.info("Created table and function")
     except Exception as e:
@@ -1,8 +1,14 @@
+import functools
 import subprocess
 
 
+@functools.cache
 def check_docker_running():
     """Check if Docker is running.
+
+    The positive result is cached for the process lifetime, since Docker
+    does not stop between calls within one script run.
+
     Returns:
         bool: True if Docker is running, raises RuntimeError otherwise.
     """
@@ -4,13 +4,22 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import aiofiles
+import functools
 import logging
 import asyncio
 import os
 import json
+import re
 import socket
+import requests
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available, fall back to the pure-Python emitter
+    from yaml import SafeDumper
+
 from supabase_e2e_methods import main_test
 from docker_check import check_docker_running
 from create_table_and_function import create_table_and_function
@@ -27,24 +36,66 @@ class SupabaseCommandError(Exception):
     pass
 
 
+# One pass over the raw status blob instead of splitting it into lines
+# and substring-matching each one.
+_STATUS_RE = re.compile(
+    r"^\s*(API URL|DB URL|anon key|service_role key)\s*:\s*(\S+)", re.M
+)
+_FIELD_MAP = {
+    "API URL": "supabase_url",
+    "DB URL": "supabase_db_url",
+    "anon key": "supabase_anon_key",
+    "service_role key": "supabase_service_role_key",
+}
+
+# Credential keys are fixed, so their env-var spellings can be computed once.
+_KEYS_UPPER = {
+    k: k.upper()
+    for k in (
+        "supabase_url",
+        "supabase_db_url",
+        "supabase_anon_key",
+        "supabase_service_role_key",
+    )
+}
+
+# Local stacks serve the API here by default; seeding it lets readiness
+# polling go over HTTP from the very first start instead of forking the
+# supabase CLI per iteration. _remember_api_url overrides it when status
+# reports a different URL.
+_api_url = "http://localhost:54321"
+
+
+def _remember_api_url(status: str) -> None:
+    global _api_url
+    for match in _STATUS_RE.finditer(status):
+        if match[1] == "API URL":
+            _api_url = match[2]
+            break
+
+
+async def _service_ready(url: str) -> bool:
+    """Check the REST endpoint directly; any HTTP response means the stack is up."""
+    try:
+        await asyncio.to_thread(requests.head, f"{url}/rest/v1/", timeout=1.0)
+        return True
+    except requests.exceptions.RequestException:
+        return False
+
+
+@functools.cache
+def _host() -> str:
+    """Resolve the local host address once; it is invariant for the process."""
+    return socket.gethostbyname(socket.gethostname())
+
+
 async def get_db_credentials() -> dict:
     credentials = {}
-    host = socket.gethostbyname(socket.gethostname())
+    host = _host()
     try:
         status = await get_supabase_status()
-        for line in status.split("\n"):
-            if "API URL" in line:
-                credentials["supabase_url"] = line.split(": ")[1].replace(
-                    "localhost", host
-                )
-            elif "DB URL" in line:
-                credentials["supabase_db_url"] = line.split(": ")[1].replace(
-                    "localhost", host
-                )
-            elif "anon key" in line:
-                credentials["supabase_anon_key"] = line.split(": ")[1]
-            elif "service_role key" in line:
-                credentials["supabase_service_role_key"] = line.split(": ")[1]
+        for match in _STATUS_RE.finditer(status):
+            credentials[_FIELD_MAP[match[1]]] = match[2].replace("localhost", host)
     except Exception as e:
         logger.error(f"Error getting Supabase status: {str(e)}")
         raise SupabaseCommandError("Error getting Supabase status") from e
@@ -114,8 +165,10 @@ async def write_e2e_test_config_file(credentials: dict) -> bool:
     logger.info("Updating e2e_test_config.yml file with: %s", credentials)
 
     try:
-        with open("config/e2e_test_config.yml", "w") as config_file:
-            yaml.dump(credentials, config_file, default_flow_style=False)
+        async with aiofiles.open("config/e2e_test_config.yml", "w") as config_file:
+            await config_file.write(
+                yaml.dump(credentials, Dumper=SafeDumper, default_flow_style=False)
+            )
         return True
     except Exception as error:
         logger.error(
@@ -129,29 +182,51 @@ async def reset_env_file(credentials: dict) -> bool:
         logger.error("No credentials provided to write to .env file")
         return False
 
-    env_vars = "\n".join([f"{k.upper()}={v}" for k, v in credentials.items()])
-    logger.info("Updating .env file with: %s", env_vars)
+    payload = "\n".join(
+        f"{_KEYS_UPPER.get(k, k.upper())}={v}" for k, v in credentials.items()
+    ).encode()
+    logger.info("Updating .env file with: %s", payload.decode())
 
     try:
-        with open(".env", "w") as env_file:
-            env_file.write(env_vars)
+        async with aiofiles.open(".env", "wb") as env_file:
+            await env_file.write(payload)
         return True
     except Exception as error:
         logger.error(f"Failed to write to .env file due to error: {str(error)}")
         return False
 
 
-async def start_supabase() -> bool:
-    for _ in range(3):
+async def start_supabase(timeout: float = 30.0) -> bool:
+    try:
+        await run_supabase_command("start")
+    except SupabaseCommandError:
+        await stop_supabase()
         try:
             await run_supabase_command("start")
-            await asyncio.sleep(3)  # Wait for 3 seconds
-            status = await get_supabase_status()
-            if "DB URL" in status:
-                return True
         except SupabaseCommandError:
-            await stop_supabase()
-            await asyncio.sleep(3)  # Wait for 3 seconds
+            return False
+
+    # Poll for readiness with exponential backoff instead of fixed sleeps,
+    # so a fast start is detected in ~100 ms rather than seconds.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.1
+    while loop.time() < deadline:
+        if await _service_ready(_api_url):
+            return True
+        if delay >= 1.0:
+            # HTTP has failed for a while; the stack may be on a
+            # non-default port, so fall back to CLI status to learn the
+            # real API URL.
+            try:
+                status = await get_supabase_status()
+                if "DB URL" in status:
+                    _remember_api_url(status)
+                    return True
+            except SupabaseCommandError:
+                pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
     return False
 
 
@@ -171,7 +246,6 @@ async def get_supabase_credentials() -> str:
             await run_supabase_command("init")
 
         await stop_supabase()
-        await asyncio.sleep(3)  # Wait for 3 seconds
 
         if not await start_supabase():
             raise RuntimeError("Failed to start Supabase after multiple attempts.")
@@ -1,14 +1,38 @@
 # Path: scripts/local_supabase_e2e.py
+import asyncio
+import copy
 import logging
 import os
 import yaml
 import sys
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available, fall back to the pure-Python parser
+    from yaml import SafeLoader
+
 sys.path.append("..")
-from supacrud import Supabase
+from supacrud.async_base import AsyncSupabase
 
 logger = logging.getLogger(__name__)
 
+# Parsed configs keyed by path, guarded by (mtime, size) so an unchanged
+# file is never re-parsed.
+_CONFIG_CACHE: dict = {}
+
+
+def load_config(path: str) -> dict:
+    """Load a YAML config file, reusing the parsed result while it is unchanged."""
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+        return copy.deepcopy(cached[2])
+    with open(key, "r") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    _CONFIG_CACHE[key] = (stat.st_mtime, stat.st_size, data)
+    return copy.deepcopy(data)
+
 NAME = "John Doe"
 EMAIL = "john.doe@example.com"
 STORY = "The Tale of John Doe"
@@ -16,9 +40,9 @@ AGE = 32
 STORY_NAME_EDITED = "The Tale of Jane Doe And His Past."
 
 
-def setup_supacrud(credentials: dict) -> Supabase:
+def setup_supacrud(credentials: dict) -> AsyncSupabase:
     try:
-        db = Supabase(
+        db = AsyncSupabase(
             credentials["supabase_url"],
             credentials["supabase_service_role_key"],
             credentials["supabase_anon_key"],
@@ -30,28 +54,37 @@ def setup_supacrud(credentials: dict) -> Supabase:
         raise
 
 
-def test_supacrud_create(db: Supabase) -> None:
-    # Create operation
-    user = {
-        "author_name": NAME,
-        "author_email": EMAIL,
-        "author_age": AGE,
-        "story_name": STORY,
-    }
-    logger.info("Creating a story: %s", user)
-    created_user = db.create("rest/v1/stories", user)
-    logger.info("** Story created **: %s", created_user)
-
-
-def test_supacrud_read(db: Supabase) -> str:
+async def test_supacrud_create(db: AsyncSupabase) -> None:
+    # Create operation: insert all stories with one bulk request
+    stories = [
+        {
+            "author_name": NAME,
+            "author_email": EMAIL,
+            "author_age": AGE,
+            "story_name": STORY,
+        },
+        {
+            "author_name": NAME,
+            "author_email": EMAIL,
+            "author_age": AGE,
+            "story_name": f"{STORY}, Part Two",
+        },
+    ]
+    logger.info("Creating stories: %s", stories)
+    created = await db.create("rest/v1/stories", stories)
+    logger.info("** Stories created **: %s", created)
+
+
+async def test_supacrud_read(db: AsyncSupabase) -> list:
     # Read operation
     logger.info("Reading story with email: %s", EMAIL)
-    stories = db.read("rest/v1/stories")
+    response = await db.read("rest/v1/stories")
+    stories = response.json()
     logger.info("Read stories: %s", stories)
-    return stories[0]["id"]
+    return [story["id"] for story in stories]
 
 
-def test_supacrud_update(db: Supabase) -> None:
+async def test_supacrud_update(db: AsyncSupabase, id: str) -> None:
     # Update operation
     story = {
         "author_name": NAME,
@@ -59,33 +92,35 @@ def test_supacrud_update(db: Supabase) -> None:
         "author_age": AGE,
         "story_name": STORY_NAME_EDITED,
     }
-    id = test_supacrud_read(db)
     logger.info("Updating story: %s", story)
-    db.update(f"rest/v1/stories?id=eq.{id}", story)
+    await db.update(f"rest/v1/stories?id=eq.{id}", story)
     logger.info("Story updated: %s", story)
 
 
-def test_supacrud_delete(db: Supabase, id: str) -> None:
+async def test_supacrud_delete(db: AsyncSupabase, id: str) -> None:
     # Delete operation
     logger.info("Deleting a story with id: %s", id)
-    db.delete(f"rest/v1/stories?id=eq.{id}")
+    await db.delete(f"rest/v1/stories?id=eq.{id}")
     logger.info("Story deleted: %s", id)
 
 
-def test_supacrud_rpc(db: Supabase) -> None:
+async def test_supacrud_rpc(db: AsyncSupabase) -> None:
     logger.info("Getting a story using a function by author_email")
-    db.rpc("rest/v1/rpc/get_story_by_email", {"author_email_param": EMAIL})
+    await db.rpc("rest/v1/rpc/get_story_by_email", {"author_email_param": EMAIL})
     logger.info("Procedure get_story_by_email called")
 
 
-def main_test(credentials: dict) -> bool:
+async def main_test_async(credentials: dict) -> bool:
     try:
-        db = setup_supacrud(credentials)
-        test_supacrud_create(db)
-        id = test_supacrud_read(db)
-        test_supacrud_update(db)
-        test_supacrud_delete(db, id)
-        test_supacrud_rpc(db)
+        async with setup_supacrud(credentials) as db:
+            # The create and rpc probes are independent, as are the final
+            # update and delete, so each pair shares one round-trip window.
+            await asyncio.gather(test_supacrud_create(db), test_supacrud_rpc(db))
+            ids = await test_supacrud_read(db)
+            await asyncio.gather(
+                test_supacrud_update(db, ids[0]),
+                test_supacrud_delete(db, ids[-1]),
+            )
         logger.info("All Supabase CRUD operations completed successfully")
         return True
     except Exception as e:
@@ -93,10 +128,13 @@ def main_test(credentials: dict) -> bool:
         return False
 
 
+def main_test(credentials: dict) -> bool:
+    return asyncio.run(main_test_async(credentials))
+
+
 def main() -> None:
     logger.info("Running Supabase E2E tests")
-    with open(os.path.join("config", "e2e_test_config.yml"), "r") as f:
-        credentials = yaml.safe_load(f)
+    credentials = load_config(os.path.join("config", "e2e_test_config.yml"))
     main_test(credentials)
 
 
@@ -1,3 +1,3 @@
 # Path: supacrud/__init__.py
-from .base import Supabase, SupabaseError, ResponseType
+from .base import BatchCall, Supabase, SupabaseError, ResponseType, parse_json
 from .retry_on_status_const import RETRY_ON_STATUS
@@ -0,0 +1,207 @@
+import logging
+from typing import Dict, List, Optional, Any, Union
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from supacrud.base import SupabaseError
+from supacrud.retry_on_status_const import RETRY_ON_STATUS
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseRequester:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        token: str,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        retry_on_status: List[int] = RETRY_ON_STATUS,
+        max_connections: int = 64,
+        http2: bool = True,
+    ):
+        """
+        Initializes the AsyncBaseRequester instance.
+
+        Args:
+            base_url (str): The base URL for the API.
+            api_key (str): The API key to be used for authentication.
+            token (str): The token to be used for authentication.
+            max_retries (int, optional): Maximum number of retries for the request. Defaults to 3.
+            backoff_factor (float, optional): The factor to use for backoff between retries. Defaults to 2.0.
+            retry_on_status (List[int], optional): List of status codes to retry on. Defaults to [429, 500, 502, 503, 504, 520, 521, 522, 523, 524, 525, 526].
+            max_connections (int, optional): Maximum number of connections in the pool. Defaults to 64.
+            http2 (bool, optional): Whether to multiplex requests over HTTP/2. With HTTP/2, concurrent
+                calls share one TLS connection instead of queueing for pool slots. Defaults to True.
+
+        """
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_on_status = retry_on_status
+
+        # Connect-level retries live in the transport; retries on status
+        # codes and timeouts are handled by tenacity inside execute.
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"apikey": api_key, "Authorization": f"Bearer {token}"},
+            transport=httpx.AsyncHTTPTransport(
+                retries=max_retries,
+                http2=http2,
+                limits=httpx.Limits(max_connections=max_connections),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying client and release its pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncBaseRequester":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _retryable(self, exception: BaseException) -> bool:
+        """Return True for transient transport errors and retryable statuses."""
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code in self.retry_on_status
+        return isinstance(exception, (httpx.ConnectError, httpx.TimeoutException))
+
+    async def execute(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        full_representation: bool = False,
+    ) -> httpx.Response:
+        # As in the sync client, minimal requests omit Prefer entirely; an
+        # empty value is wasted bytes and some intermediaries reject it.
+        headers = {"Prefer": "return=representation"} if full_representation else None
+        url = self.base_url + (path[1:] if path.startswith("/") else path)
+        response = None
+        try:
+            logger.debug("Sending %s request to %s", method, url)
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.max_retries + 1),
+                wait=wait_random_exponential(multiplier=self.backoff_factor, max=6),
+                retry=retry_if_exception(self._retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    response = await self.client.request(
+                        method, path, headers=headers, json=data
+                    )
+                    response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.debug("Received status code %s from %s", e.response.status_code, url)
+            raise SupabaseError(
+                message=e.response.text,
+                status_code=e.response.status_code,
+                url=url,
+            )
+        except httpx.RequestError as e:
+            raise SupabaseError(message=str(e), url=url)
+        return response
+
+
+class AsyncSupabase(AsyncBaseRequester):
+    """An asynchronous Python client for interacting with a Supabase database.
+
+    Unlike the synchronous `Supabase` client, requests issued here do not
+    block the event loop, so independent operations can be overlapped with
+    `asyncio.gather`.
+
+    Examples:
+        >>> async with AsyncSupabase("https://example.com", "service_role_key", "anon_key") as supabase:
+        ...     await asyncio.gather(
+        ...         supabase.create("rest/v1/users", {"name": "John Doe"}),
+        ...         supabase.rpc("rest/v1/rpc/get_users", {}),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        service_role_key: str,
+        anon_key: str,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        retry_on_status: List[int] = RETRY_ON_STATUS,
+        max_connections: int = 64,
+        http2: bool = True,
+    ):
+        """Initialize the client with the base URL, service role key, and anon key.
+
+        Args:
+            base_url (str): The base URL of the Supabase API.
+            service_role_key (str): The service role key for the Supabase API.
+            anon_key (str): The anonymous key for the Supabase API.
+            max_retries (int, optional): Maximum number of retries for the request. Defaults to 3.
+            backoff_factor (float, optional): The factor to use for backoff between retries. Defaults to 2.0.
+            retry_on_status (List[int], optional): List of status codes to retry on. Defaults to [429, 500, 502, 503, 504, 520, 521, 522, 523, 524, 525, 526].
+            max_connections (int, optional): Maximum number of connections in the pool. Defaults to 64.
+            http2 (bool, optional): Whether to multiplex requests over HTTP/2. Defaults to True.
+
+        """
+        super().__init__(
+            base_url=base_url,
+            api_key=anon_key,
+            token=service_role_key,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            retry_on_status=retry_on_status,
+            max_connections=max_connections,
+            http2=http2,
+        )
+
+    async def create(
+        self, url: str, data: Dict[str, Any], full_representation: bool = False
+    ) -> httpx.Response:
+        """Create a record at the specified URL, POST request."""
+        logger.debug("Performing POST operation at %s", url)
+        return await self.execute(
+            "POST", url, data=data, full_representation=full_representation
+        )
+
+    async def read(self, url: str, full_representation: bool = False) -> httpx.Response:
+        """Read records from the specified URL, GET request."""
+        logger.debug("Performing GET operation at %s", url)
+        return await self.execute("GET", url, full_representation=full_representation)
+
+    async def update(
+        self, url: str, data: Dict[str, Any], full_representation: bool = False
+    ) -> httpx.Response:
+        """Update records at the specified URL, PATCH request."""
+        logger.debug("Performing PATCH operation at %s", url)
+        return await self.execute(
+            "PATCH", url, data=data, full_representation=full_representation
+        )
+
+    async def delete(
+        self, url: str, full_representation: bool = False
+    ) -> httpx.Response:
+        """Delete records at the specified URL, DELETE request."""
+        logger.debug("Performing DELETE operation at %s", url)
+        return await self.execute(
+            "DELETE", url, full_representation=full_representation
+        )
+
+    async def rpc(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        full_representation: bool = False,
+    ) -> httpx.Response:
+        """Perform a POST request at the specified URL."""
+        logger.debug("Performing RPC operation at %s", url)
+        return await self.execute(
+            "POST", url, data=params, full_representation=full_representation
+        )
@@ -1,15 +1,70 @@
+import json
 import requests
 import logging
-from typing import Dict, List, Optional, Any, Union
-from urllib.parse import urljoin
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any, Union
 
-from supacrud.retry import create_retry_session
-from supacrud.retry_on_status_const import RETRY_ON_STATUS
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up, stdlib json works too
+    orjson = None
+
+from supacrud.retry import _get_shared_session
+from supacrud.retry_on_status_const import RETRY_METHODS, RETRY_ON_STATUS
 
 ResponseType = Union[Dict[str, Any], List[Dict[str, Any]]]
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached (ETag, response) pairs per client instance.
+ETAG_CACHE_MAXSIZE = 1024
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body to JSON bytes with the fastest encoder available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def parse_json(response: requests.Response) -> ResponseType:
+    """Decode a response body with the fastest JSON parser available.
+
+    Prefer this over response.json() for large result sets: orjson parses
+    the raw bytes directly, skipping the intermediate str that the stdlib
+    parser builds.
+
+    Args:
+        response (requests.Response): The response to decode.
+
+    Returns:
+        ResponseType: The parsed JSON body.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@dataclass
+class BatchCall:
+    """One operation in a Supabase.batch request.
+
+    Attributes:
+        method (str): The HTTP method of the operation.
+        path (str): The path of the operation, e.g. "rest/v1/stories".
+        data (Optional[Dict[str, Any]]): The payload for the operation.
+        input_from (Optional[int]): Index of an earlier call in the batch
+            whose result feeds this call's data.
+    """
+
+    method: str
+    path: str
+    data: Optional[Dict[str, Any]] = None
+    input_from: Optional[int] = None
+
 
 class SupabaseError(Exception):
     """Custom exception for Supabase errors."""
@@ -40,15 +95,10 @@ class BaseRequester:
         max_retries: int = 3,
         backoff_factor: float = 2.0,
         retry_on_status: List[int] = RETRY_ON_STATUS,
-        retry_methods: List[str] = [
-            "HEAD",
-            "GET",
-            "OPTIONS",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-        ],
+        retry_methods: List[str] = RETRY_METHODS,
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
     ):
         """
         Initializes the BaseRequester instance.
@@ -61,38 +111,117 @@ class BaseRequester:
             backoff_factor (float, optional): The factor to use for backoff between retries. Defaults to 2.0.
             retry_on_status (List[int], optional): List of status codes to retry on. Defaults to [429, 500, 502, 503, 504, 520, 521, 522, 523, 524, 525, 526].
             retry_methods (List[str], optional): List of HTTP methods to retry. Defaults to ["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"].
+            pool_connections (int, optional): Number of per-host connection pools to keep. Defaults to 32.
+            pool_maxsize (int, optional): Connections kept alive per pool. For a thread pool of size N, set both pool values to at least N. Defaults to 32.
+            pool_block (bool, optional): Whether to block when the pool is exhausted. Defaults to False.
 
         """
         self.base_url = base_url if base_url.endswith("/") else base_url + "/"
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
 
-        self.session = create_retry_session(
-            api_key=api_key,
-            token=token,
+        # Auth stays on the instance and is merged in per request, so
+        # clients with the same retry configuration can share one pool.
+        self._auth_headers = {
+            "apikey": api_key,
+            "Authorization": f"Bearer {token}",
+        }
+        # Precomputed header dicts for the common paths; execute copies
+        # them only when a call needs extra headers. Minimal requests send
+        # no Prefer header at all: an empty value is wasted bytes and some
+        # intermediaries treat it as malformed.
+        self._headers_min = dict(self._auth_headers)
+        self._headers_full = {**self._auth_headers, "Prefer": "return=representation"}
+        # LRU of url -> (etag, response) used for conditional GETs. The
+        # lock keeps it consistent when read_many fans GETs out over a
+        # thread pool.
+        self._etag_cache: OrderedDict = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self.session = _get_shared_session(
             total_retries=self.max_retries,
-            retry_on_status=retry_on_status,
-            retry_methods=retry_methods,
+            retry_on_status=tuple(retry_on_status),
+            retry_methods=tuple(retry_methods),
             backoff_factor=self.backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
+        # The shared session outlives any one client; close() must not
+        # tear it down under other live clients.
+        self._owns_session = False
+
+    def _join(self, path: str) -> str:
+        """Resolve a path against the base URL.
+
+        base_url is normalized to end with a slash in __init__ and the
+        paths this client sends are always relative, so plain
+        concatenation matches urljoin without re-parsing the base URL on
+        every request.
+        """
+        return self.base_url + (path[1:] if path.startswith("/") else path)
+
+    def close(self) -> None:
+        """Release the session's pooled connections.
+
+        The default session is shared between clients with the same retry
+        configuration, so this is a no-op unless the instance owns its
+        session (e.g. a caller assigned a private one); closing the shared
+        pool would dump warm keep-alive sockets other clients are using.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "BaseRequester":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def execute(
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Dict[str, Any]], bytes, str]] = None,
         full_representation: bool = False,
+        merge_duplicates: bool = False,
     ) -> requests.Response:
-        url = urljoin(self.base_url, path)
-        headers = {"Prefer": "return=representation" if full_representation else ""}
+        """Send a request, serializing data unless it is already JSON bytes/str."""
+        url = self._join(path)
+        if merge_duplicates:
+            prefer = ["resolution=merge-duplicates"]
+            if full_representation:
+                prefer.insert(0, "return=representation")
+            headers = dict(self._auth_headers)
+            headers["Prefer"] = ",".join(prefer)
+        else:
+            headers = self._headers_full if full_representation else self._headers_min
+        body = None
+        if data is not None:
+            # Callers that already hold serialized JSON pass straight through.
+            body = data if isinstance(data, (bytes, str)) else _dumps(data)
+            headers = {**headers, "Content-Type": "application/json"}
+        cached = None
+        if method == "GET":
+            with self._etag_lock:
+                cached = self._etag_cache.get(url)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
         try:
-            logger.debug(f"Sending {method} request to {url}")
+            logger.debug("Sending %s request to %s", method, url)
             response = self.session.request(
-                method=method, url=url, headers=headers, json=data
+                method=method, url=url, headers=headers, data=body
             )
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Resource at %s unchanged, serving cached response", url)
+                with self._etag_lock:
+                    # Reinsert rather than move_to_end: a concurrent
+                    # eviction may have dropped the key in the meantime.
+                    self._etag_cache[url] = cached
+                    self._etag_cache.move_to_end(url)
+                return cached[1]
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
-            logger.debug(f"Received status code {e.response.status_code} from {url}")
+            logger.debug("Received status code %s from %s", e.response.status_code, url)
             message = e.response.text
             raise SupabaseError(
                 message=message,
@@ -105,6 +234,14 @@ class BaseRequester:
             raise SupabaseError(message=str(e), url=url)
         except requests.exceptions.RequestException as e:
             raise SupabaseError(message=str(e), url=url)
+        if method == "GET":
+            etag = response.headers.get("ETag")
+            if etag:
+                with self._etag_lock:
+                    self._etag_cache[url] = (etag, response)
+                    self._etag_cache.move_to_end(url)
+                    while len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                        self._etag_cache.popitem(last=False)
         return response
 
 
@@ -146,15 +283,10 @@ class Supabase(BaseRequester):
         max_retries: int = 3,
         backoff_factor: float = 2.0,
         retry_on_status: List[int] = RETRY_ON_STATUS,
-        retry_methods: List[str] = [
-            "HEAD",
-            "GET",
-            "OPTIONS",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-        ],
+        retry_methods: List[str] = RETRY_METHODS,
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
     ):
         """Initialize the client with the base URL, service role key, and anon key.
 
@@ -167,6 +299,9 @@ class Supabase(BaseRequester):
             retry_on_status (List[int], optional): List of status codes to retry on. Defaults to [429, 500, 502, 503, 504, 520, 521, 522, 523, 524, 525, 526].
                 You can override this or add to it by importing the RETRY_ON_STATUS constant, modifying it and passing it to the Supabase constructor.
             retry_methods (List[str], optional): List of HTTP methods to retry. Defaults to ["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"].
+            pool_connections (int, optional): Number of per-host connection pools to keep. Defaults to 32.
+            pool_maxsize (int, optional): Connections kept alive per pool. For a thread pool of size N, set both pool values to at least N. Defaults to 32.
+            pool_block (bool, optional): Whether to block when the pool is exhausted. Defaults to False.
 
         """
 
@@ -178,6 +313,9 @@ class Supabase(BaseRequester):
             backoff_factor=backoff_factor,
             retry_on_status=retry_on_status,
             retry_methods=retry_methods,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
 
     def create(
@@ -193,7 +331,7 @@ class Supabase(BaseRequester):
         Returns:
             ResponseType: The response from the Supabase API.
         """
-        logger.debug(f"Performing POST operation at {url}")
+        logger.debug("Performing POST operation at %s", url)
         return self.execute(
             "POST", url, data=data, full_representation=full_representation
         )
@@ -208,9 +346,70 @@ class Supabase(BaseRequester):
         Returns:
             ResponseType: The response from the Supabase API.
         """
-        logger.debug(f"Performing GET operation at {url}")
+        logger.debug("Performing GET operation at %s", url)
         return self.execute("GET", url, full_representation=full_representation)
 
+    def read_many(
+        self, urls: List[str], max_workers: int = 16
+    ) -> List[requests.Response]:
+        """Read several independent URLs concurrently, GET requests.
+
+        The reads are fanned out over a thread pool sharing the client's
+        keep-alive connection pool, so N reads take roughly one round trip
+        instead of N. Keep pool_maxsize at least as large as max_workers,
+        otherwise threads queue on connection acquisition.
+
+        Args:
+            urls (List[str]): The URLs to read records from.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 16.
+
+        Returns:
+            List[requests.Response]: The responses, in the same order as urls.
+        """
+        logger.debug("Performing %s concurrent GET operations", len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.read, urls))
+
+    def stream_read(self, url: str) -> Iterator[Dict[str, Any]]:
+        """Read records from the specified URL, yielding them incrementally.
+
+        Unlike read, the response body is never materialized in full:
+        rows are parsed as the bytes arrive, so peak memory stays flat for
+        large tables and consumers that only need the first rows can stop
+        early. Requires the optional ijson package.
+
+        Args:
+            url (str): The URL to read records from.
+
+        Yields:
+            Dict[str, Any]: One record at a time.
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "stream_read requires the optional 'ijson' package; "
+                "install it with: pip install supacrud[speed]"
+            ) from e
+        full_url = self._join(url)
+        logger.debug("Performing streaming GET operation at %s", full_url)
+        with self.session.get(
+            full_url, stream=True, headers=self._auth_headers
+        ) as response:
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                raise SupabaseError(
+                    message=e.response.text,
+                    status_code=e.response.status_code,
+                    url=full_url,
+                )
+            # The session advertises gzip/brotli, and requests leaves raw
+            # streams undecoded by default; tell urllib3 to decompress so
+            # ijson sees JSON bytes, not compressed ones.
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item")
+
     def update(
         self, url: str, data: Dict[str, Any], full_representation: bool = False
     ) -> requests.Response:
@@ -224,7 +423,7 @@ class Supabase(BaseRequester):
         Returns:
             ResponseType: The response from the Supabase API.
         """
-        logger.debug(f"Performing PATCH operation at {url}")
+        logger.debug("Performing PATCH operation at %s", url)
         return self.execute(
             "PATCH", url, data=data, full_representation=full_representation
         )
@@ -239,9 +438,138 @@ class Supabase(BaseRequester):
         Returns:
             ResponseType: The response from the Supabase API.
         """
-        logger.debug(f"Performing DELETE operation at {url}")
+        logger.debug("Performing DELETE operation at %s", url)
         return self.execute("DELETE", url, full_representation=full_representation)
 
+    def bulk_create(
+        self, url: str, rows: List[Dict[str, Any]], full_representation: bool = False
+    ) -> requests.Response:
+        """Create multiple records in a single POST request.
+
+        PostgREST accepts a JSON array natively, so N rows cost one round
+        trip instead of N.
+
+        Args:
+            url (str): The URL to create the records at.
+            rows (List[Dict[str, Any]]): The rows to insert.
+            full_representation (bool, optional): Whether to return the full representation of the resource. Defaults to False.
+
+        Returns:
+            ResponseType: The response from the Supabase API.
+        """
+        logger.debug("Performing bulk POST operation at %s", url)
+        return self.execute(
+            "POST", url, data=rows, full_representation=full_representation
+        )
+
+    def bulk_upsert(
+        self,
+        url: str,
+        rows: List[Dict[str, Any]],
+        on_conflict: str = "id",
+        full_representation: bool = False,
+    ) -> requests.Response:
+        """Insert or update multiple records in a single POST request.
+
+        Sends the rows with `Prefer: resolution=merge-duplicates` so rows
+        that collide on the conflict column are updated in place.
+
+        Args:
+            url (str): The URL to upsert the records at.
+            rows (List[Dict[str, Any]]): The rows to upsert.
+            on_conflict (str, optional): The column used to detect duplicates. Defaults to "id".
+            full_representation (bool, optional): Whether to return the full representation of the resource. Defaults to False.
+
+        Returns:
+            ResponseType: The response from the Supabase API.
+        """
+        separator = "&" if "?" in url else "?"
+        logger.debug("Performing bulk upsert operation at %s", url)
+        return self.execute(
+            "POST",
+            f"{url}{separator}on_conflict={on_conflict}",
+            data=rows,
+            full_representation=full_representation,
+            merge_duplicates=True,
+        )
+
+    def bulk_delete(
+        self,
+        url: str,
+        ids: List[Any],
+        column: str = "id",
+        full_representation: bool = False,
+    ) -> requests.Response:
+        """Delete multiple records in a single DELETE request.
+
+        Builds an `in.(...)` filter so N deletes cost one round trip.
+
+        Args:
+            url (str): The URL to delete the records at.
+            ids (List[Any]): The values to match against the filter column.
+            column (str, optional): The column to filter on. Defaults to "id".
+            full_representation (bool, optional): Whether to return the full representation of the resource. Defaults to False.
+
+        Returns:
+            ResponseType: The response from the Supabase API.
+        """
+        separator = "&" if "?" in url else "?"
+        id_filter = ",".join(str(id) for id in ids)
+        logger.debug("Performing bulk DELETE operation at %s", url)
+        return self.execute(
+            "DELETE",
+            f"{url}{separator}{column}=in.({id_filter})",
+            full_representation=full_representation,
+        )
+
+    def batch(
+        self,
+        calls: List[BatchCall],
+        rpc_path: str = "rest/v1/rpc/execute_batch",
+    ) -> Union[requests.Response, List[requests.Response]]:
+        """Run several dependent operations in a single round trip.
+
+        Sends the call list to a project-level execute_batch(jsonb) RPC
+        function, which executes them server-side in order so N dependent
+        operations cost one round trip instead of N. If the RPC is not
+        installed (404), falls back to executing the calls sequentially,
+        resolving input_from references client-side.
+
+        Args:
+            calls (List[BatchCall]): The operations to run, in order.
+            rpc_path (str, optional): Path of the batch RPC function. Defaults to "rest/v1/rpc/execute_batch".
+
+        Returns:
+            Union[requests.Response, List[requests.Response]]: The RPC
+            response (whose body is the array of results), or the list of
+            per-call responses when falling back to sequential execution.
+        """
+        payload = {
+            "calls": [
+                {
+                    "method": call.method,
+                    "path": call.path,
+                    "data": call.data,
+                    "input_from": call.input_from,
+                }
+                for call in calls
+            ]
+        }
+        try:
+            logger.debug("Performing batch operation with %s calls", len(calls))
+            return self.rpc(rpc_path, payload)
+        except SupabaseError as e:
+            if e.status_code != 404:
+                raise
+            logger.debug("execute_batch RPC not installed, executing sequentially")
+        results: List[requests.Response] = []
+        for call in calls:
+            data = call.data
+            if call.input_from is not None:
+                data = parse_json(results[call.input_from])
+            results.append(self.execute(call.method, call.path, data=data))
+        return results
+
     def rpc(
         self,
         url: str,
@@ -258,7 +586,7 @@ class Supabase(BaseRequester):
         Returns:
             ResponseType: The response from the Supabase API.
         """
-        logger.debug(f"Performing RPC operation at {url}")
+        logger.debug("Performing RPC operation at %s", url)
         return self.execute(
             "POST", url, data=params, full_representation=full_representation
         )
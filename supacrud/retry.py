@@ -1,13 +1,147 @@
 import logging
+import random
 import requests
+from functools import lru_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import List
+from typing import List, Tuple
 
-from supacrud.retry_on_status_const import RETRY_ON_STATUS
+from supacrud.retry_on_status_const import RETRY_METHODS, RETRY_ON_STATUS
 
 logger = logging.getLogger(__name__)
 
+# Only advertise brotli when a decoder is installed, otherwise urllib3
+# could not decompress what the server sends back.
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# SystemRandom so forked workers do not inherit a correlated PRNG state
+# and retry in lockstep anyway.
+_jitter = random.SystemRandom()
+
+
+class FullJitterRetry(Retry):
+    """Retry strategy whose backoff is drawn uniformly from [0, exponential).
+
+    Pure exponential backoff wakes every client that hit the same 429/503
+    at the same instant, so they re-collide on the next attempt. Full
+    jitter spreads the retries across the whole backoff window.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return _jitter.uniform(0, backoff)
+
+
+# Prebuilt Retry templates keyed by configuration. Retry construction
+# builds frozensets and copies a dozen attributes; Retry.new() clones the
+# template far more cheaply.
+_RETRY_TEMPLATES: dict = {}
+
+
+def _get_retry_strategy(
+    total_retries: int,
+    retry_on_status: List[int],
+    retry_methods: List[str],
+    backoff_factor: float,
+) -> FullJitterRetry:
+    """Return a clone of the memoized retry template for this configuration."""
+    key = (total_retries, tuple(retry_on_status), tuple(retry_methods), backoff_factor)
+    template = _RETRY_TEMPLATES.get(key)
+    if template is None:
+        # respect_retry_after_header keeps Retry-After handling inside
+        # urllib3, so there is no second retry/sleep layer in Python.
+        template = FullJitterRetry(
+            total=total_retries,
+            status_forcelist=retry_on_status,
+            allowed_methods=retry_methods,
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        _RETRY_TEMPLATES[key] = template
+    return template.new()
+
+
+@lru_cache(maxsize=None)
+def _get_shared_session(
+    total_retries: int,
+    retry_on_status: Tuple[int, ...],
+    retry_methods: Tuple[str, ...],
+    backoff_factor: float,
+    pool_connections: int = 32,
+    pool_maxsize: int = 32,
+    pool_block: bool = False,
+) -> requests.Session:
+    """
+    Return the process-wide session for a retry configuration.
+
+    Sessions are cached by their retry parameters so every client with the
+    same configuration shares one connection pool and its warm keep-alive
+    sockets. Authentication headers are deliberately not set here; callers
+    must supply them per request so multiple clients can share the pool.
+
+    Args:
+        total_retries (int): Total number of retries. 0 means no retries.
+        retry_on_status (Tuple[int, ...]): Status codes to retry on.
+        retry_methods (Tuple[str, ...]): HTTP methods to retry.
+        backoff_factor (float): Backoff factor for retries.
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Connections kept alive per pool. For a thread
+            pool of size N, set both pool values to at least N, otherwise
+            urllib3 discards the extra connections and keep-alive is lost.
+        pool_block (bool): Whether to block when the pool is exhausted.
+
+    Returns:
+        requests.Session: The shared session for this configuration.
+    """
+    retry_strategy = _get_retry_strategy(
+        total_retries, list(retry_on_status), list(retry_methods), backoff_factor
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def _validate_config(
+    api_key, token, total_retries, retry_on_status, retry_methods, backoff_factor
+) -> None:
+    """Type-check session configuration; stripped entirely under python -O."""
+    if not isinstance(api_key, str):
+        raise TypeError("api_key must be a string")
+    if not isinstance(token, str):
+        raise TypeError("token must be a string")
+    if not isinstance(total_retries, int):
+        raise TypeError("total_retries must be an integer")
+    if total_retries == 0:
+        # Retries are disabled, so the retry arguments are never used and
+        # need not be checked.
+        return
+    if not isinstance(retry_on_status, list) or not all(
+        isinstance(status, int) for status in retry_on_status
+    ):
+        raise TypeError("retry_on_status must be a list of integers")
+    if not isinstance(retry_methods, list) or not all(
+        isinstance(method, str) for method in retry_methods
+    ):
+        raise TypeError("retry_methods must be a list of strings")
+    if not isinstance(backoff_factor, (int, float)):
+        raise TypeError("backoff_factor must be an integer or float")
+
 
 def create_retry_session(
     api_key: str,
@@ -16,6 +150,9 @@ def create_retry_session(
     retry_on_status: List[int] = None,
     retry_methods: List[str] = None,
     backoff_factor: (int, float) = 1,
+    pool_connections: int = 32,
+    pool_maxsize: int = 32,
+    pool_block: bool = False,
 ) -> requests.Session:
     """
     Create a requests session with a retry strategy.
@@ -27,6 +164,10 @@ def create_retry_session(
         retry_on_status (List[int]): List of status codes to retry on.
         retry_methods (List[str]): List of HTTP methods to retry.
         backoff_factor (int, float): Backoff factor for retries.
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Connections kept alive per pool. For a thread
+            pool of size N, set both pool values to at least N.
+        pool_block (bool): Whether to block when the pool is exhausted.
 
     Returns:
         requests.Session: A requests session with a configured retry strategy.
@@ -34,47 +175,40 @@ def create_retry_session(
     if retry_on_status is None:
         retry_on_status = RETRY_ON_STATUS
     if retry_methods is None:
-        retry_methods = [
-            "HEAD",
-            "GET",
-            "OPTIONS",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-        ]
+        retry_methods = RETRY_METHODS
 
-    if not isinstance(api_key, str):
-        raise TypeError("api_key must be a string")
-    if not isinstance(token, str):
-        raise TypeError("token must be a string")
-    if not isinstance(total_retries, int):
-        raise TypeError("total_retries must be an integer")
-    if not isinstance(retry_on_status, list) or not all(
-        isinstance(status, int) for status in retry_on_status
-    ):
-        raise TypeError("retry_on_status must be a list of integers")
-    if not isinstance(retry_methods, list) or not all(
-        isinstance(method, str) for method in retry_methods
-    ):
-        raise TypeError("retry_methods must be a list of strings")
-    if not isinstance(backoff_factor, (int, float)):
-        raise TypeError("backoff_factor must be an integer or float")
+    if __debug__:
+        _validate_config(
+            api_key, token, total_retries, retry_on_status, retry_methods,
+            backoff_factor,
+        )
 
     try:
-        retry_strategy = Retry(
-            total=total_retries,
-            status_forcelist=retry_on_status,
-            allowed_methods=retry_methods,
-            backoff_factor=backoff_factor,
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        if total_retries == 0:
+            # Retries disabled: mount a plain adapter and skip Retry
+            # construction entirely, e.g. for callers with their own
+            # circuit breaker.
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+        else:
+            retry_strategy = _get_retry_strategy(
+                total_retries, retry_on_status, retry_methods, backoff_factor
+            )
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
         session = requests.Session()
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         session.headers["apikey"] = api_key
         session.headers["Authorization"] = f"Bearer {token}"
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
     except Exception as e:
         logger.error("Error creating retry session", exc_info=True)
         raise e
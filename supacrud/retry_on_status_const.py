@@ -12,3 +12,13 @@ RETRY_ON_STATUS = [
     525,
     526,
 ]
+
+RETRY_METHODS = [
+    "HEAD",
+    "GET",
+    "OPTIONS",
+    "POST",
+    "PUT",
+    "PATCH",
+    "DELETE",
+]
@@ -1,42 +1,87 @@
 # conftest.py
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock
+from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.response import HTTPResponse
 from supacrud import Supabase
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """
+    Retry tests honor Retry-After and backoff, which would really sleep
+    between attempts. Neutralize time.sleep everywhere so no test spends
+    wall-clock time waiting.
+    """
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", lambda *_: None, raising=False)
+
+
+@pytest.fixture
+def mock_get_conn(monkeypatch):
+    """
+    This fixture patches urllib3's connection acquisition once, instead of
+    each retry test entering and exiting its own @patch decorator.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr(HTTPConnectionPool, "_get_conn", mock)
+    return mock
+
+
+@pytest.fixture
+def fake_session():
+    """
+    This fixture returns a factory for session stubs whose request method
+    always yields the given response, replacing the per-module MockSession
+    classes with one shared Mock-based helper.
+    """
+
+    def make(response):
+        session = Mock(spec_set=["request", "headers"])
+        session.request.return_value = response
+        return session
+
+    return make
+
+
 @pytest.fixture
 def supabase():
     base_url = "http://example.com"
-    service_role_key = "key"
-    return Supabase(base_url, service_role_key)
+    service_role_key = "service_role_key"
+    anon_key = "anon_key"
+    return Supabase(base_url, service_role_key, anon_key)
+
+
+@pytest.fixture(scope="module")
+def _proto_responses():
+    """
+    This fixture builds the spec'd response mocks once per module;
+    MagicMock(spec=HTTPResponse) introspects the whole class, so paying
+    that cost per test adds up.
+    """
+
+    def make(status, reason, headers=None):
+        mock_response = MagicMock(spec=HTTPResponse)
+        mock_response.status = status
+        mock_response.reason = reason
+        mock_response.headers = headers or {}
+        mock_response.length_remaining = 0
+        mock_response.getheader.return_value = (
+            headers.get("Retry-After") if headers else None
+        )
+        return mock_response
+
+    return [
+        make(500, "Internal Server Error", {"Retry-After": "1"}),
+        make(429, "Too Many Requests", {"Retry-After": "1"}),
+        make(200, "OK"),
+    ]
 
 
 @pytest.fixture
-def mock_responses():
+def mock_responses(_proto_responses):
     """
-    This fixture creates a list of mock HTTP responses.
+    This fixture returns the list of mock HTTP responses.
     Each response is a MagicMock object that mimics the behavior of an HTTPResponse object.
     """
-    mock_response = MagicMock(spec=HTTPResponse)
-    mock_response.status = 500
-    mock_response.getheader.return_value = "1"
-    mock_response.headers = {"Retry-After": "1"}
-    mock_response.length_remaining = 0
-    mock_response.reason = "Internal Server Error"
-
-    mock_response2 = MagicMock(spec=HTTPResponse)
-    mock_response2.status = 429
-    mock_response2.getheader.return_value = "1"
-    mock_response2.headers = {"Retry-After": "1"}
-    mock_response2.length_remaining = 0
-    mock_response2.reason = "Too Many Requests"
-
-    mock_response3 = MagicMock(spec=HTTPResponse)
-    mock_response3.status = 200
-    mock_response3.getheader.return_value = None
-    mock_response3.headers = {}
-    mock_response3.length_remaining = 0
-    mock_response3.reason = "OK"
-
-    return [mock_response, mock_response2, mock_response3]
+    return list(_proto_responses)
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+from supacrud import SupabaseError
+
+httpx = pytest.importorskip("httpx")
+
+from supacrud.async_base import AsyncSupabase  # noqa: E402
+
+
+def make_supabase(handler) -> AsyncSupabase:
+    supabase = AsyncSupabase("https://example.com", "service_role_key", "anon_key")
+    supabase.client = httpx.AsyncClient(
+        base_url=supabase.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return supabase
+
+
+def test_async_execute_success():
+    response_data = {"message": "Success"}
+
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(response_data).encode())
+
+    async def run():
+        async with make_supabase(handler) as supabase:
+            return await supabase.execute("GET", "/path")
+
+    result = asyncio.run(run())
+
+    assert result.json() == response_data
+
+
+def test_async_execute_http_error():
+    def handler(request):
+        return httpx.Response(400, content=b'{"message": "Error"}')
+
+    async def run():
+        async with make_supabase(handler) as supabase:
+            await supabase.execute("GET", "/path")
+
+    with pytest.raises(SupabaseError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.status_code == 400
+
+
+def test_async_gather_crud():
+    def handler(request):
+        return httpx.Response(200, content=b"{}")
+
+    async def run():
+        async with make_supabase(handler) as supabase:
+            return await asyncio.gather(
+                supabase.create("/path", {"key": "value"}),
+                supabase.read("/path"),
+                supabase.rpc("/path", {"param": "value"}),
+            )
+
+    results = asyncio.run(run())
+
+    assert all(response.status_code == 200 for response in results)
@@ -1,17 +1,17 @@
 import pytest
-from unittest.mock import (
-    patch,
-    create_autospec,
-    MagicMock,
-)
+from unittest.mock import MagicMock, patch
 import requests
 from requests_mock.mocker import Mocker
 from requests.exceptions import HTTPError
-import urllib3
 import json
+from urllib.parse import urljoin
 
 from supacrud.base import BaseRequester
 
+BASE_URL = "http://example.com"
+API_KEY = "test_api_key"
+TOKEN = "test_token"
+
 
 class MockResponse:
     """
@@ -57,20 +57,22 @@ class MockResponse:
 
 
 class MockHTTPResponse:
+    """A lightweight stand-in for urllib3.response.HTTPResponse.
+
+    Plain attribute assignment instead of create_autospec, which walks the
+    whole HTTPResponse class on every instantiation.
+    """
+
     def __init__(self, status: int, data: bytes = b"", headers: dict = None):
-        self.response = create_autospec(urllib3.response.HTTPResponse, instance=True)
-        self.response.status = status
-        self.response.data = data
-        self.response.length_remaining = len(data)
-        self.response.headers = headers if headers else {}
-        self.response.closed = False
-        self.response.reason = "OK"
-        self.response.version = "HTTP/1.1"
-        self.response.streaming = False
-        self.response.preload_content = False
-
-    def __getattr__(self, attr):
-        return getattr(self.response, attr)
+        self.status = status
+        self.data = data
+        self.length_remaining = len(data)
+        self.headers = headers if headers else {}
+        self.closed = False
+        self.reason = "OK"
+        self.version = "HTTP/1.1"
+        self.streaming = False
+        self.preload_content = False
 
     @staticmethod
     def create(status_code: int, json_data: dict):
@@ -80,46 +82,64 @@ class MockHTTPResponse:
         return response
 
     def raise_for_status(self):
-        if self.response.status >= 400:
-            http_error_msg = f"{self.response.status} Server Error"
+        if self.status >= 400:
+            http_error_msg = f"{self.status} Server Error"
             raise HTTPError(http_error_msg, response=self)
 
 
-def test_base_requester_instantiation():
-    base_url = "http://example.com"
-    api_key = "test_api_key"
-    token = "test_token"
-    requester = BaseRequester(base_url, api_key, token)
+@pytest.mark.parametrize(
+    "retry_kwargs",
+    [
+        {},
+        {"retry_on_status": [429, 500, 502, 503, 504, 599]},
+        {"retry_methods": ["GET", "POST"]},
+    ],
+)
+def test_base_requester_instantiation(retry_kwargs):
+    requester = BaseRequester(BASE_URL, API_KEY, TOKEN, **retry_kwargs)
 
     assert requester.base_url == "http://example.com/"
     assert isinstance(requester.session, requests.Session)
 
 
-def test_base_requester_instantiation_with_additional_status_codes():
-    base_url = "http://example.com"
+@pytest.mark.parametrize("base_url", ["http://example.com", "http://example.com/"])
+def test_base_url_formatting(base_url):
+    requester = BaseRequester(base_url, API_KEY, TOKEN)
 
+    assert requester.base_url == "http://example.com/"
 
-def test_base_url_formatting():
-    base_url_without_slash = "http://example.com"
-    base_url_with_slash = "http://example.com/"
-    headers = {"Authorization": "Bearer token"}
 
-    requester = BaseRequester(
-        base_url_without_slash,
-        "test_api_key",
-        "test_token",
-    )
-    assert requester.base_url == "http://example.com/"
+@pytest.mark.parametrize(
+    "path",
+    [
+        "rest/v1/stories",
+        "/rest/v1/stories",
+        "rest/v1/stories?id=eq.1",
+        "rest/v1/rpc/my_function",
+        "/rest/v1/rpc/my_function",
+    ],
+)
+def test_join_matches_urljoin(path):
+    """
+    This test checks that the fast path join produces the same URL as
+    urllib.parse.urljoin for the relative paths the client sends.
+    """
+    requester = BaseRequester(BASE_URL, API_KEY, TOKEN)
+    assert requester._join(path) == urljoin(requester.base_url, path)
 
-    requester = BaseRequester(
-        base_url_with_slash,
-        "test_api_key",
-        "test_token",
-    )
-    assert requester.base_url == "http://example.com/"
+
+def test_close_leaves_shared_session_open():
+    """
+    This test checks that exiting a client context does not close the
+    process-wide session other clients may still be using.
+    """
+    requester = BaseRequester(BASE_URL, API_KEY, TOKEN)
+    with patch.object(requester.session, "close") as mock_close:
+        with requester:
+            pass
+    mock_close.assert_not_called()
 
 
-@patch.object(urllib3.HTTPConnectionPool, "_get_conn", autospec=True)
 def test_retry_mechanism(mock_get_conn, mock_responses):
     """
     This test checks if the retry mechanism works as expected.
@@ -129,18 +149,16 @@ def test_retry_mechanism(mock_get_conn, mock_responses):
     mock_get_conn.return_value = mock_conn
     requester = BaseRequester(
         base_url="http://mockserver",
-        api_key="test_api_key",
-        token="test_token",
+        api_key=API_KEY,
+        token=TOKEN,
     )
     response = requester.execute("GET", "/unavailable-endpoint")
     assert mock_get_conn.call_count == 3
 
 
 def test_headers():
-    base_url = "http://example.com"
     api_key = "key"
-    token = "test_token"
-    requester = BaseRequester(base_url, api_key, token)
+    requester = BaseRequester(BASE_URL, api_key, TOKEN)
 
     with Mocker() as m:
         m.get(
@@ -148,11 +166,11 @@ def test_headers():
             headers={
                 "Prefer": "return=representation",
                 "apikey": api_key,
-                "Authorization": f"Bearer {token}",
+                "Authorization": f"Bearer {TOKEN}",
             },
         )
         requester.execute("GET", "/unavailable-endpoint", full_representation=True)
 
     assert "return=representation" == m.last_request.headers["Prefer"]
     assert api_key == m.last_request.headers["apikey"]
-    assert f"Bearer {token}" == m.last_request.headers["Authorization"]
+    assert f"Bearer {TOKEN}" == m.last_request.headers["Authorization"]
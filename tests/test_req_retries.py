@@ -1,12 +1,13 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from urllib3.connectionpool import HTTPConnectionPool
 from urllib3.response import HTTPResponse
 
 from supacrud.retry import create_retry_session
 
+API_KEY = "test_key"
+TOKEN = "test_token"
+
 
-@patch.object(HTTPConnectionPool, "_get_conn", autospec=True)
 def test_create_retry_session_retries(mock_get_conn, mock_responses):
     """
     This test checks if the create_retry_session function correctly retries when it receives a 500 or 429 status code.
@@ -14,12 +15,11 @@ def test_create_retry_session_retries(mock_get_conn, mock_responses):
     mock_conn = MagicMock()
     mock_conn.getresponse.side_effect = mock_responses
     mock_get_conn.return_value = mock_conn
-    session = create_retry_session(api_key="test_key", token="test_token")
+    session = create_retry_session(api_key=API_KEY, token=TOKEN)
     response = session.get("http://mockserver/unavailable-endpoint")
     assert mock_get_conn.call_count == 3
 
 
-@patch.object(HTTPConnectionPool, "_get_conn", autospec=True)
 def test_create_retry_session_no_retries(mock_get_conn):
     """
     This test checks if the create_retry_session function does not retry when it receives a 200 status code.
@@ -35,6 +35,36 @@ def test_create_retry_session_no_retries(mock_get_conn):
     mock_conn.getresponse.return_value = mock_response
     mock_get_conn.return_value = mock_conn
 
-    session = create_retry_session(api_key="test_key", token="test_token")
+    session = create_retry_session(api_key=API_KEY, token=TOKEN)
     response = session.get("http://mockserver/unavailable-endpoint")
     assert mock_get_conn.call_count == 1
+
+
+@patch("urllib3.util.retry.time.sleep")
+def test_create_retry_session_single_backoff_layer(mock_sleep, mock_get_conn):
+    """
+    This test checks that a 500-then-200 sequence sleeps exactly once inside
+    urllib3's retry machinery, with no extra Python-level retry layer.
+    """
+    mock_error = MagicMock(spec=HTTPResponse)
+    mock_error.status = 500
+    mock_error.getheader.return_value = "1"
+    mock_error.headers = {"Retry-After": "1"}
+    mock_error.length_remaining = 0
+    mock_error.reason = "Internal Server Error"
+
+    mock_ok = MagicMock(spec=HTTPResponse)
+    mock_ok.status = 200
+    mock_ok.getheader.return_value = None
+    mock_ok.headers = {}
+    mock_ok.length_remaining = 0
+    mock_ok.reason = "OK"
+
+    mock_conn = MagicMock()
+    mock_conn.getresponse.side_effect = [mock_error, mock_ok]
+    mock_get_conn.return_value = mock_conn
+
+    session = create_retry_session(api_key=API_KEY, token=TOKEN)
+    response = session.get("http://mockserver/unavailable-endpoint")
+    assert mock_get_conn.call_count == 2
+    assert mock_sleep.call_count == 1
@@ -1,16 +1,58 @@
 import pytest
-from unittest.mock import patch
-from unittest.mock import patch, MagicMock
-from urllib3.connectionpool import HTTPConnectionPool
+from unittest.mock import MagicMock
 from urllib3.response import HTTPResponse
-from supacrud.retry import create_retry_session
+from functools import lru_cache
+
+from supacrud.retry import ACCEPT_ENCODING, create_retry_session
+
+API_KEY = "test_key"
+TOKEN = "test_token"
+
+
+@pytest.fixture(scope="class")
+def cached_session():
+    """
+    Memoize create_retry_session by its arguments so the assertion-only
+    tests below share one session instead of rebuilding Retry objects and
+    adapters per test. List arguments are frozen to tuples for hashing.
+    """
+
+    @lru_cache(maxsize=None)
+    def _build(api_key, token, total_retries, retry_on_status, retry_methods, backoff_factor):
+        return create_retry_session(
+            api_key=api_key,
+            token=token,
+            total_retries=total_retries,
+            retry_on_status=list(retry_on_status) if retry_on_status else None,
+            retry_methods=list(retry_methods) if retry_methods else None,
+            backoff_factor=backoff_factor,
+        )
+
+    def make(
+        api_key,
+        token,
+        total_retries=3,
+        retry_on_status=None,
+        retry_methods=None,
+        backoff_factor=1,
+    ):
+        return _build(
+            api_key,
+            token,
+            total_retries,
+            tuple(retry_on_status) if retry_on_status else None,
+            tuple(retry_methods) if retry_methods else None,
+            backoff_factor,
+        )
+
+    return make
 
 
 class TestCreateRetrySession:
-    def test_default_retry_settings(self):
-        session = create_retry_session(api_key="test_key", token="test_token")
-        assert session.headers["apikey"] == "test_key"
-        assert session.headers["Authorization"] == "Bearer test_token"
+    def test_default_retry_settings(self, cached_session):
+        session = cached_session(api_key=API_KEY, token=TOKEN)
+        assert session.headers["apikey"] == API_KEY
+        assert session.headers["Authorization"] == f"Bearer {TOKEN}"
         adapter = session.adapters["http://"]
         assert adapter.max_retries.total == 3
         assert adapter.max_retries.status_forcelist == [
@@ -38,71 +80,60 @@ class TestCreateRetrySession:
         ]
         assert adapter.max_retries.backoff_factor == 1
 
-    def test_custom_retry_settings(self):
-        session = create_retry_session(
-            api_key="test_key",
-            token="test_token",
+    def test_custom_retry_settings(self, cached_session):
+        session = cached_session(
+            api_key=API_KEY,
+            token=TOKEN,
             total_retries=5,
             retry_on_status=[400, 401, 403],
             retry_methods=["GET", "POST"],
             backoff_factor=2,
         )
-        assert session.headers["apikey"] == "test_key"
-        assert session.headers["Authorization"] == "Bearer test_token"
+        assert session.headers["apikey"] == API_KEY
+        assert session.headers["Authorization"] == f"Bearer {TOKEN}"
         adapter = session.adapters["http://"]
         assert adapter.max_retries.total == 5
         assert adapter.max_retries.status_forcelist == [400, 401, 403]
         assert adapter.max_retries.allowed_methods == ["GET", "POST"]
         assert adapter.max_retries.backoff_factor == 2
 
-    def test_session_headers(self):
-        session = create_retry_session(api_key="test_key", token="test_token")
-        assert session.headers["apikey"] == "test_key"
-        assert session.headers["Authorization"] == "Bearer test_token"
+    def test_zero_retries_mounts_plain_adapter(self, cached_session):
+        session = cached_session(
+            api_key=API_KEY, token=TOKEN, total_retries=0
+        )
+        adapter = session.adapters["http://"]
+        assert adapter.max_retries.total == 0
+        assert not adapter.max_retries.status_forcelist
+
+    def test_session_headers(self, cached_session):
+        session = cached_session(api_key=API_KEY, token=TOKEN)
+        assert session.headers["apikey"] == API_KEY
+        assert session.headers["Authorization"] == f"Bearer {TOKEN}"
+
+    def test_accept_encoding_header(self, cached_session):
+        session = cached_session(api_key=API_KEY, token=TOKEN)
+        assert session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in session.headers["Accept-Encoding"]
 
     def test_api_key_type_error(self):
         with pytest.raises(TypeError):
-            create_retry_session(api_key=123, token="test_token")
+            create_retry_session(api_key=123, token=TOKEN)
 
     def test_token_type_error(self):
         with pytest.raises(TypeError):
-            create_retry_session(api_key="test_key", token=123)
+            create_retry_session(api_key=API_KEY, token=123)
 
     def test_total_retries_type_error(self):
         with pytest.raises(TypeError):
             create_retry_session(
-                api_key="test_key", token="test_token", total_retries="3"
+                api_key=API_KEY, token=TOKEN, total_retries="3"
             )
 
 
-def test_create_retry_session_retries():
-    with patch.object(HTTPConnectionPool, "_get_conn", autospec=True) as mock_get_conn:
-
-        mock_response = MagicMock(spec=HTTPResponse)
-        mock_response.status = 500
-        mock_response.getheader.return_value = "1"
-        mock_response.headers = {"Retry-After": "1"}
-        mock_response.length_remaining = 0
-        mock_response.reason = "Internal Server Error"
-        mock_response2 = MagicMock(spec=HTTPResponse)
-        mock_response2.status = 429
-        mock_response2.getheader.return_value = "1"
-        mock_response2.headers = {"Retry-After": "1"}
-        mock_response2.length_remaining = 0
-        mock_response2.reason = "Too Many Requests"
-        mock_response3 = MagicMock(spec=HTTPResponse)
-        mock_response3.status = 200
-        mock_response3.getheader.return_value = None
-        mock_response3.headers = {}
-        mock_response3.length_remaining = 0
-        mock_response3.reason = "OK"
-        mock_conn = MagicMock()
-        mock_conn.getresponse.side_effect = [
-            mock_response,
-            mock_response2,
-            mock_response3,
-        ]
-        mock_get_conn.return_value = mock_conn
-        session = create_retry_session(api_key="test_key", token="test_token")
-        response = session.get("http://mockserver/unavailable-endpoint")
-        assert mock_get_conn.call_count == 3
+def test_create_retry_session_retries(mock_get_conn, mock_responses):
+    mock_conn = MagicMock()
+    mock_conn.getresponse.side_effect = mock_responses
+    mock_get_conn.return_value = mock_conn
+    session = create_retry_session(api_key=API_KEY, token=TOKEN)
+    response = session.get("http://mockserver/unavailable-endpoint")
+    assert mock_get_conn.call_count == 3
@@ -1,75 +1,103 @@
 import pytest
 import json
 import requests
-from unittest.mock import patch, create_autospec
+from unittest.mock import patch, Mock
 
-from supacrud import Supabase, SupabaseError
+from supacrud import BatchCall, Supabase, SupabaseError
+
+BASE_URL = "https://example.com"
+PATH = "/path"
+
+# Payloads shared across tests, encoded once at import instead of per test.
+OK_BODY = json.dumps({"message": "ok"}).encode("utf-8")
+SUCCESS_DATA = {"message": "Success"}
+SUCCESS_BODY = json.dumps(SUCCESS_DATA).encode("utf-8")
 
 
 class MockResponse(requests.Response):
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data=None, status_code=200, content=None):
         super(MockResponse, self).__init__()
-        self._content = json.dumps(json_data).encode("utf-8")
+        self._content = (
+            content if content is not None else json.dumps(json_data).encode("utf-8")
+        )
         self.status_code = status_code
         self.encoding = "utf-8"
 
 
-class MockSession:
-    def __init__(self, response):
-        self.response = response
+@pytest.fixture(scope="module")
+def module_supabase():
+    """One client for the whole module; building it per test repeats
+    session and adapter setup for no benefit."""
+    return Supabase(BASE_URL, "service_role_key", "anon_key")
 
-    def request(self, method, url, **kwargs):
-        return self.response
+
+@pytest.fixture(scope="module")
+def _module_session(module_supabase):
+    return module_supabase.session
 
 
 @pytest.fixture
-def supabase():
-    base_url = "https://example.com"
-    service_role_key = "service_role_key"
-    anon_key = "anon_key"
-    return Supabase(base_url, service_role_key, anon_key)
+def supabase(module_supabase, _module_session):
+    # Restore the real session and drop any cached conditional-GET state
+    # so the mock session a previous test installed cannot leak across.
+    module_supabase.session = _module_session
+    module_supabase._etag_cache.clear()
+    return module_supabase
 
 
 def create_mock_response(json_data, status_code=200):
-    mock_response = create_autospec(requests.Response, instance=True)
+    # A narrow spec_set instead of create_autospec, which recursively
+    # specs every Response method per call. headers stays in the spec for
+    # the ETag cache path in execute.
+    mock_response = Mock(spec_set=["json", "status_code", "raise_for_status", "headers"])
     mock_response.json.return_value = json_data
     mock_response.status_code = status_code
+    mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     return mock_response
 
 
-def test_execute_success(supabase):
-    response_data = {"message": "Success"}
-    response = MockResponse(json_data=response_data, status_code=200)
-    session = MockSession(response)
-    supabase.session = session
+def test_execute_success(supabase, fake_session):
+    response = MockResponse(status_code=200, content=SUCCESS_BODY)
+    supabase.session = fake_session(response)
 
-    result = supabase.execute("GET", "/path")
+    result = supabase.execute("GET", PATH)
 
-    assert result.json() == response_data
+    assert result.json() == SUCCESS_DATA
 
 
-def test_execute_http_error(supabase):
+def test_execute_http_error(supabase, fake_session):
     response_data = {"message": "Error"}
     response = MockResponse(json_data=response_data, status_code=400)
-    session = MockSession(response)
-    supabase.session = session
+    supabase.session = fake_session(response)
 
     with pytest.raises(SupabaseError) as excinfo:
-        supabase.execute("GET", "/path")
+        supabase.execute("GET", PATH)
 
     assert excinfo.value.status_code == 400
     assert response_data["message"] in str(excinfo.value)
 
 
-def test_create(supabase):
-    response_data = {"message": "Record created"}
-    response = MockResponse(json_data=response_data, status_code=201)
-    session = MockSession(response)
-    supabase.session = session
+CRUD_CASES = [
+    ("create", "POST", (PATH, {"key": "value"}), 201),
+    ("update", "PATCH", (PATH, {"id": 1, "name": "John Doe"}), 200),
+    ("delete", "DELETE", (PATH,), 200),
+    ("rpc", "POST", (PATH, {"param": "value"}), 200),
+]
+
+
+@pytest.mark.parametrize("method_name,http_method,args,status_code", CRUD_CASES)
+def test_crud(supabase, fake_session, method_name, http_method, args, status_code):
+    response = MockResponse(status_code=status_code, content=OK_BODY)
+    supabase.session = fake_session(response)
 
-    result = supabase.create("/path", {"key": "value"})
+    result = getattr(supabase, method_name)(*args)
 
     assert result == response
+    # Assert only the fields that matter; header propagation has its own test.
+    kwargs = supabase.session.request.call_args.kwargs
+    assert kwargs["method"] == http_method
+    assert kwargs["url"] == BASE_URL + PATH
 
 
 def test_read(supabase):
@@ -77,38 +105,149 @@ def test_read(supabase):
     mock_response = create_mock_response(response_data)
 
     with patch("requests.Session.request", return_value=mock_response):
-        result = supabase.read("/path")
+        result = supabase.read(PATH)
         assert result == mock_response
 
 
-def test_update(supabase):
-    response_data = {"message": "Record updated"}
-    response = MockResponse(json_data=response_data, status_code=200)
-    session = MockSession(response)
+def test_stream_read(supabase):
+    pytest.importorskip("ijson")
+    from requests_mock.mocker import Mocker
+
+    response_data = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+
+    with Mocker() as m:
+        m.get("https://example.com/path", json=response_data)
+        result = list(supabase.stream_read(PATH))
+
+    assert result == response_data
+
+
+def test_stream_read_gzip(supabase):
+    pytest.importorskip("ijson")
+    import gzip
+    from requests_mock.mocker import Mocker
+
+    response_data = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+    compressed = gzip.compress(json.dumps(response_data).encode("utf-8"))
+
+    with Mocker() as m:
+        m.get(
+            "https://example.com/path",
+            content=compressed,
+            headers={"Content-Encoding": "gzip"},
+        )
+        result = list(supabase.stream_read(PATH))
+
+    assert result == response_data
+
+
+def test_read_many(supabase):
+    class UrlEchoSession:
+        def request(self, method, url, **kwargs):
+            return MockResponse(json_data={"url": url}, status_code=200)
+
+    supabase.session = UrlEchoSession()
+
+    results = supabase.read_many(["/path1", "/path2", "/path3"], max_workers=2)
+
+    assert [r.json()["url"] for r in results] == [
+        "https://example.com/path1",
+        "https://example.com/path2",
+        "https://example.com/path3",
+    ]
+
+
+def test_read_etag_cache(supabase):
+    response_data = [{"id": 1, "name": "John"}]
+    fresh = MockResponse(json_data=response_data, status_code=200)
+    fresh.headers["ETag"] = '"abc123"'
+    not_modified = MockResponse(json_data=None, status_code=304)
+
+    class RecordingSession:
+        def __init__(self, responses):
+            self.responses = list(responses)
+            self.calls = []
+
+        def request(self, method, url, **kwargs):
+            self.calls.append(kwargs)
+            return self.responses.pop(0)
+
+    session = RecordingSession([fresh, not_modified])
     supabase.session = session
 
-    result = supabase.update("/path", {"id": 1, "name": "John Doe"})
+    first = supabase.read(PATH)
+    second = supabase.read(PATH)
+
+    assert first == fresh
+    assert second == fresh
+    assert "If-None-Match" not in session.calls[0]["headers"]
+    assert session.calls[1]["headers"]["If-None-Match"] == '"abc123"'
+
+
+def test_bulk_create(supabase, fake_session):
+    response_data = [{"id": 1}, {"id": 2}]
+    response = MockResponse(json_data=response_data, status_code=201)
+    supabase.session = fake_session(response)
+
+    result = supabase.bulk_create(PATH, [{"key": "one"}, {"key": "two"}])
 
     assert result == response
 
 
-def test_delete(supabase):
-    response_data = {"message": "Record deleted"}
+def test_bulk_upsert(supabase, fake_session):
+    response_data = [{"id": 1}, {"id": 2}]
     response = MockResponse(json_data=response_data, status_code=200)
-    session = MockSession(response)
-    supabase.session = session
+    supabase.session = fake_session(response)
 
-    result = supabase.delete("/path")
+    result = supabase.bulk_upsert(PATH, [{"id": 1}, {"id": 2}])
 
     assert result == response
 
 
-def test_rpc(supabase):
-    response_data = {"message": "RPC operation performed"}
+def test_bulk_delete(supabase, fake_session):
+    response_data = []
     response = MockResponse(json_data=response_data, status_code=200)
-    session = MockSession(response)
-    supabase.session = session
+    supabase.session = fake_session(response)
 
-    result = supabase.rpc("/path", {"param": "value"})
+    result = supabase.bulk_delete(PATH, [1, 2, 3])
 
     assert result == response
+
+
+def test_batch_via_rpc(supabase, fake_session):
+    response_data = [{"id": 1}, {"id": 2}]
+    response = MockResponse(json_data=response_data, status_code=200)
+    supabase.session = fake_session(response)
+
+    result = supabase.batch(
+        [
+            BatchCall("POST", "rest/v1/stories", {"story_name": "A"}),
+            BatchCall("GET", "rest/v1/stories"),
+        ]
+    )
+
+    assert result == response
+
+
+def test_batch_sequential_fallback(supabase):
+    rpc_missing = MockResponse(json_data={"message": "Not Found"}, status_code=404)
+    created = MockResponse(json_data=[{"id": 1}], status_code=201)
+    read = MockResponse(json_data=[{"id": 1}], status_code=200)
+
+    class FallbackSession:
+        def __init__(self, responses):
+            self.responses = list(responses)
+
+        def request(self, method, url, **kwargs):
+            return self.responses.pop(0)
+
+    supabase.session = FallbackSession([rpc_missing, created, read])
+
+    result = supabase.batch(
+        [
+            BatchCall("POST", "rest/v1/stories", {"story_name": "A"}),
+            BatchCall("GET", "rest/v1/stories"),
+        ]
+    )
+
+    assert result == [created, read]